@@ -30,6 +30,12 @@ if ! flyctl apps show $APP_NAME &> /dev/null; then
     flyctl apps create $APP_NAME --org personal
 fi
 
+# Create the volume for persistent OAuth client storage if it doesn't exist
+if ! flyctl volumes list --app $APP_NAME | grep -q ticktick_data; then
+    echo "💾 Creating volume for OAuth client storage"
+    flyctl volumes create ticktick_data --region $REGION --size 1 --app $APP_NAME --yes
+fi
+
 # Set secrets from .env file if it exists
 if [ -f ".env" ]; then
     echo "🔑 Setting secrets from .env file"
@@ -0,0 +1,14 @@
+#!/bin/sh
+# Fix ownership of the persistent volume, then run the server as appuser.
+# A Fly volume mounted at /data hides the image's /data, so its root-owned root has to be chowned at runtime.
+
+set -e
+
+if [ "$(id -u)" = "0" ]; then
+    if [ -d /data ]; then
+        chown -R appuser:appuser /data
+    fi
+    exec setpriv --reuid=appuser --regid=appuser --init-groups "$@"
+fi
+
+exec "$@"
@@ -1,17 +1,51 @@
 import asyncio
+import base64
+import binascii
+import bisect
+import hashlib
 import json
 import os
 import logging
+import re
+import time
+from collections import OrderedDict, defaultdict
+from functools import lru_cache
+from pathlib import Path
 from datetime import datetime, timezone, date, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Set, Tuple, Union, TYPE_CHECKING
 
+import orjson
 from fastmcp import FastMCP
 # OAuth Proxy is automatically configured by FastMCP from environment variables
 from dotenv import load_dotenv
-from fastmcp.server.dependencies import get_http_request
+from fastmcp.server.dependencies import get_context, get_http_request
+from fastmcp.server.middleware import Middleware, MiddlewareContext
+from fastmcp.exceptions import ToolError
 from starlette.requests import Request
 
+# Optional FastMCP features; not every FastMCP version ships them
+try:
+    from fastmcp.server.auth import OAuthProxy
+    from fastmcp.server.auth.oauth_proxy import TokenVerifier, AccessToken
+    import aiohttp
+    _oauth_import_error = None
+except ImportError as e:
+    OAuthProxy = None
+    _oauth_import_error = e
+
+try:
+    from fastmcp.utilities.storage import JSONFileStorage
+except ImportError:
+    JSONFileStorage = None
+
+try:
+    from fastmcp.server.dependencies import get_identity
+except ImportError:
+    get_identity = None
+
 # Delay importing TickTickClient to runtime to avoid ModuleNotFoundError during container import
+if TYPE_CHECKING:
+    from ticktick_client import TickTickClient
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -20,16 +54,36 @@ logger = logging.getLogger(__name__)
 # Load environment variables (enables OAuth Proxy auto-config if set)
 load_dotenv()
 
+# TickTick OAuth endpoints. They are handed to OAuthProxy directly, so the proxy never runs
+# upstream discovery and serves its own authorization server metadata from this static config.
+TICKTICK_AUTHORIZATION_ENDPOINT = "https://ticktick.com/oauth/authorize"
+TICKTICK_TOKEN_ENDPOINT = "https://ticktick.com/oauth/token"
+# Cheapest authenticated endpoint, used to check that a token is valid
+TICKTICK_VERIFY_URL = "https://api.ticktick.com/open/v1/project"
+
+# How long a successful token verification is reused before asking TickTick again
+TOKEN_VERIFY_CACHE_TTL = float(os.getenv("TICKTICK_TOKEN_CACHE_TTL", "300"))
+# Maximum number of tokens kept in the verification and client caches
+TOKEN_CACHE_MAX_ENTRIES = int(os.getenv("TICKTICK_TOKEN_CACHE_MAX_ENTRIES", "1024"))
+
+def _token_key(token: str) -> str:
+    """Hash a token so raw credentials are never used as cache keys."""
+    return hashlib.sha256(token.encode()).hexdigest()[:16]
+
+def _cache_put(cache: "OrderedDict[str, Any]", key: str, value: Any, max_entries: int) -> None:
+    """Store a value in a per-token cache, dropping the least recently stored entries beyond max_entries."""
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > max_entries:
+        cache.popitem(last=False)
+
 
 # OAuth Proxy setup for TickTick (following FastMCP documentation)
+@lru_cache(maxsize=1)
 def create_oauth_proxy():
-    """Create OAuth Proxy for TickTick according to FastMCP docs"""
-    try:
-        from fastmcp.server.auth import OAuthProxy
-        from fastmcp.server.auth.oauth_proxy import TokenVerifier, AccessToken
-        import aiohttp
-    except ImportError as e:
-        print(f"⚠️  OAuthProxy not available in this FastMCP version: {e}")
+    """Create OAuth Proxy for TickTick according to FastMCP docs (built once, then reused)"""
+    if OAuthProxy is None:
+        logger.warning(f"OAuthProxy not available in this FastMCP version: {_oauth_import_error}")
         return None
     
     # Get OAuth credentials from environment
@@ -39,19 +93,53 @@ def create_oauth_proxy():
     base_url = os.getenv("FASTMCP_SERVER_AUTH_OAUTH_PROXY_BASE_URL", "http://localhost:8000")
     
     if not (client_id and client_secret):
-        print("⚠️  No TickTick OAuth credentials found. Set TICKTICK_CLIENT_ID and TICKTICK_CLIENT_SECRET")
+        logger.warning("No TickTick OAuth credentials found. Set TICKTICK_CLIENT_ID and TICKTICK_CLIENT_SECRET")
         return None
     
-    print(f"✅ Creating OAuth Proxy for TickTick (client_id: {client_id[:8]}...)")
-    print(f"🌐 Base URL: {base_url}")
+    logger.info(f"Creating OAuth Proxy for TickTick (client_id: {client_id[:8]}...)")
+    logger.info(f"Base URL: {base_url}")
+    
+    # Keep OAuth client registrations on a persistent volume so clients survive restarts
+    # Setting TICKTICK_OAUTH_STORAGE_DIR opts in, so failing to use it is fatal rather than a silent fallback
+    client_storage = None
+    storage_dir = os.getenv("TICKTICK_OAUTH_STORAGE_DIR")
+    if storage_dir:
+        if JSONFileStorage is None:
+            raise RuntimeError("TICKTICK_OAUTH_STORAGE_DIR is set but this FastMCP version has no JSONFileStorage")
+        try:
+            client_storage = JSONFileStorage(Path(storage_dir))
+        except OSError as e:
+            logger.error(f"Cannot use OAuth client storage at {storage_dir}: {e}")
+            raise
+        if not os.access(storage_dir, os.W_OK):
+            logger.error(f"OAuth client storage at {storage_dir} is not writable")
+            raise PermissionError(f"OAuth client storage at {storage_dir} is not writable")
+        logger.info(f"OAuth client storage: {storage_dir}")
     
     # Custom token verifier for TickTick (opaque tokens)
     class TickTickTokenVerifier(TokenVerifier):
         def __init__(self, client_id: str, resource_server_url: str | None = None):
             super().__init__(resource_server_url=resource_server_url, required_scopes=[])
             self._client_id = client_id
+            # Verified tokens: token key -> (access token, expires_at on the monotonic clock)
+            self._verified: "OrderedDict[str, Tuple[AccessToken, float]]" = OrderedDict()
 
         async def verify_token(self, token: str) -> AccessToken | None:
+            """Verify token by calling TickTick's user profile endpoint, reusing recent successes"""
+            key = _token_key(token)
+            now = time.monotonic()
+            cached = self._verified.get(key)
+            if cached:
+                if now < cached[1]:
+                    return cached[0]
+                del self._verified[key]
+            
+            access_token = await self._verify_upstream(token)
+            if access_token:
+                _cache_put(self._verified, key, (access_token, now + TOKEN_VERIFY_CACHE_TTL), TOKEN_CACHE_MAX_ENTRIES)
+            return access_token
+
+        async def _verify_upstream(self, token: str) -> AccessToken | None:
             """Verify token by calling TickTick's user profile endpoint"""
             try:
                 async with aiohttp.ClientSession() as session:
@@ -59,7 +147,7 @@ def create_oauth_proxy():
                         "Authorization": f"Bearer {token}",
                         "Content-Type": "application/json"
                     }
-                    async with session.get("https://api.ticktick.com/open/v1/project", headers=headers) as response:
+                    async with session.get(TICKTICK_VERIFY_URL, headers=headers) as response:
                         if response.status == 200:
                             projects_data = await response.json()
                             # TickTick /project endpoint returns a list of projects
@@ -83,8 +171,8 @@ def create_oauth_proxy():
     
     # Create OAuth proxy according to FastMCP documentation
     return OAuthProxy(
-        upstream_authorization_endpoint="https://ticktick.com/oauth/authorize",
-        upstream_token_endpoint="https://ticktick.com/oauth/token",
+        upstream_authorization_endpoint=TICKTICK_AUTHORIZATION_ENDPOINT,
+        upstream_token_endpoint=TICKTICK_TOKEN_ENDPOINT,
         upstream_client_id=client_id,
         upstream_client_secret=client_secret,
         token_verifier=TickTickTokenVerifier(client_id=client_id, resource_server_url=base_url),
@@ -94,27 +182,41 @@ def create_oauth_proxy():
             "http://localhost:*", 
                             "http://127.0.0.1:*", 
                 "https://*.fly.dev"
-            ]
+            ],
+        client_storage=client_storage
     )
 
+def _serialize_tool_result(data: Any) -> str:
+    """Serialize structured tool results to JSON text with orjson (faster than the default)."""
+    return orjson.dumps(data, default=str).decode()
+
 # Create FastMCP server with OAuth Proxy
 oauth_proxy = create_oauth_proxy()
 if oauth_proxy:
-    print("🔐 Starting MCP server with OAuth Proxy for TickTick")
-    mcp = FastMCP("ticktick", auth=oauth_proxy)
+    logger.info("🔐 Starting MCP server with OAuth Proxy for TickTick")
+    mcp = FastMCP("ticktick", auth=oauth_proxy, tool_serializer=_serialize_tool_result)
 else:
-    print("🔓 Starting MCP server without OAuth (manual token required)")
-    mcp = FastMCP("ticktick")
+    logger.info("🔓 Starting MCP server without OAuth (manual token required)")
+    mcp = FastMCP("ticktick", tool_serializer=_serialize_tool_result)
 
-# Create TickTick client
-ticktick = None
+# TickTick clients per OAuth token: token key -> (client, expires_at on the monotonic clock)
+# Clients are re-checked against the API after TOKEN_VERIFY_CACHE_TTL so revoked tokens stop working
+_clients: "OrderedDict[str, Tuple[TickTickClient, float]]" = OrderedDict()
+
+# Cache of all tasks per OAuth token: token key -> (snapshot, expires_at on the monotonic clock)
+TASKS_CACHE_TTL = float(os.getenv("TICKTICK_CACHE_TTL", "60"))
+# Each snapshot holds every task of an account, so only keep this many tokens' snapshots
+TASKS_CACHE_MAX_ENTRIES = int(os.getenv("TICKTICK_CACHE_MAX_ENTRIES", "64"))
+_tasks_cache: "OrderedDict[str, Tuple[Dict[str, Any], float]]" = OrderedDict()
+
+# Maximum number of project task lists fetched from TickTick at the same time
+PROJECT_FETCH_CONCURRENCY = 8
 
 def get_auth_token():
     """Get OAuth access token from FastMCP auth context or fallback to environment."""
     # Try to get token from FastMCP OAuth identity (when OAuth Proxy is used)
     try:
-        from fastmcp.server.dependencies import get_identity
-        identity = get_identity()
+        identity = get_identity() if get_identity else None
         if identity:
             # Try different ways to access the token
             if hasattr(identity, 'access_token'):
@@ -130,7 +232,6 @@ def get_auth_token():
     
     # Try to get from request headers if available
     try:
-        from fastmcp.server.dependencies import get_http_request
         request = get_http_request()
         if request and hasattr(request, 'headers'):
             auth_header = request.headers.get('Authorization', '')
@@ -151,106 +252,148 @@ def get_auth_token():
     return None
 
 
-def initialize_client():
-    global ticktick
+async def initialize_client() -> Optional["TickTickClient"]:
+    """
+    Get the TickTick client for the current access token.
+    
+    Clients are checked against the API when created, then reused for TOKEN_VERIFY_CACHE_TTL seconds.
+    
+    Returns:
+        The client, or None if there is no usable token
+    """
     try:
         access_token = get_auth_token()
         if not access_token:
             logger.error("No access token available from OAuth context or headers.")
-            return False
-
+            return None
+        
+        key = _token_key(access_token)
+        cached = _clients.get(key)
+        if cached:
+            if time.monotonic() < cached[1]:
+                return cached[0]
+            del _clients[key]
 
         # Initialize the client (import lazily so the module doesn't need to exist at import time)
         from ticktick_client import TickTickClient  # noqa: WPS433
-        ticktick = TickTickClient(access_token)
+        client = TickTickClient(access_token)
+        # Snapshots are keyed on the token the client was registered under, which stays valid after a refresh
+        client.cache_key = key
         logger.info("TickTick client initialized successfully")
         
         # Test API connectivity
-        projects = ticktick.get_projects()
+        projects = await client.aget_projects()
         if 'error' in projects:
             logger.error(f"Failed to access TickTick API: {projects['error']}")
             logger.error("Your access token may have expired. Please run 'uv run -m ticktick_mcp.cli auth' to refresh it.")
-            return False
+            return None
             
         logger.info(f"Successfully connected to TickTick API with {len(projects)} projects")
-        return True
+        _cache_put(_clients, key, (client, time.monotonic() + TOKEN_VERIFY_CACHE_TTL), TOKEN_CACHE_MAX_ENTRIES)
+        return client
     except Exception as e:
         logger.error(f"Failed to initialize TickTick client: {e}")
-        return False
+        return None
+
+class TickTickClientMiddleware(Middleware):
+    """Resolve the caller's TickTick client once per tool call, before the tool runs."""
+    
+    async def on_call_tool(self, context: MiddlewareContext, call_next):
+        ticktick = await initialize_client()
+        if not ticktick:
+            raise ToolError("Failed to initialize TickTick client. Please check your API credentials.")
+        
+        context.fastmcp_context.set_state("ticktick", ticktick)
+        return await call_next(context)
+
+mcp.add_middleware(TickTickClientMiddleware())
+
+def require_client() -> "TickTickClient":
+    """Get the TickTick client that TickTickClientMiddleware resolved for the current tool call."""
+    return get_context().get_state("ticktick")
+
+PRIORITY_MAP = {0: "None", 1: "Low", 3: "Medium", 5: "High"}
+
+# Default page size for the paginated task tools
+DEFAULT_PAGE_SIZE = 50
 
 # Format a task object from TickTick for better display
 def format_task(task: Dict) -> str:
     """Format a task into a human-readable string."""
-    formatted = f"ID: {task.get('id', 'No ID')}\n"
-    formatted += f"Title: {task.get('title', 'No title')}\n"
+    start_date = task.get('startDate')
+    due_date = task.get('dueDate')
+    priority = task.get('priority', 0)
+    content = task.get('content')
+    items = task.get('items', [])
     
-    # Add project ID
-    formatted += f"Project ID: {task.get('projectId', 'None')}\n"
+    parts = [
+        f"ID: {task.get('id', 'No ID')}",
+        f"Title: {task.get('title', 'No title')}",
+        # Add project ID
+        f"Project ID: {task.get('projectId', 'None')}",
+    ]
     
     # Add dates if available
-    if task.get('startDate'):
-        formatted += f"Start Date: {task.get('startDate')}\n"
-    if task.get('dueDate'):
-        formatted += f"Due Date: {task.get('dueDate')}\n"
+    if start_date:
+        parts.append(f"Start Date: {start_date}")
+    if due_date:
+        parts.append(f"Due Date: {due_date}")
     
     # Add priority if available
-    priority_map = {0: "None", 1: "Low", 3: "Medium", 5: "High"}
-    priority = task.get('priority', 0)
-    formatted += f"Priority: {priority_map.get(priority, str(priority))}\n"
+    parts.append(f"Priority: {PRIORITY_MAP.get(priority, str(priority))}")
     
     # Add status if available
     status = "Completed" if task.get('status') == 2 else "Active"
-    formatted += f"Status: {status}\n"
+    parts.append(f"Status: {status}")
     
     # Add content if available
-    if task.get('content'):
-        formatted += f"\nContent:\n{task.get('content')}\n"
+    if content:
+        parts.append(f"\nContent:\n{content}")
     
     # Add subtasks if available
-    items = task.get('items', [])
     if items:
-        formatted += f"\nSubtasks ({len(items)}):\n"
+        parts.append(f"\nSubtasks ({len(items)}):")
         for i, item in enumerate(items, 1):
             status = "✓" if item.get('status') == 1 else "□"
-            formatted += f"{i}. [{status}] {item.get('title', 'No title')}\n"
+            parts.append(f"{i}. [{status}] {item.get('title', 'No title')}")
     
-    return formatted
+    return "\n".join(parts) + "\n"
 
 # Format a project object from TickTick for better display
 def format_project(project: Dict) -> str:
     """Format a project into a human-readable string."""
-    formatted = f"Name: {project.get('name', 'No name')}\n"
-    formatted += f"ID: {project.get('id', 'No ID')}\n"
+    parts = [
+        f"Name: {project.get('name', 'No name')}",
+        f"ID: {project.get('id', 'No ID')}",
+    ]
     
     # Add color if available
     if project.get('color'):
-        formatted += f"Color: {project.get('color')}\n"
+        parts.append(f"Color: {project.get('color')}")
     
     # Add view mode if available
     if project.get('viewMode'):
-        formatted += f"View Mode: {project.get('viewMode')}\n"
+        parts.append(f"View Mode: {project.get('viewMode')}")
     
     # Add closed status if available
     if 'closed' in project:
-        formatted += f"Closed: {'Yes' if project.get('closed') else 'No'}\n"
+        parts.append(f"Closed: {'Yes' if project.get('closed') else 'No'}")
     
     # Add kind if available
     if project.get('kind'):
-        formatted += f"Kind: {project.get('kind')}\n"
+        parts.append(f"Kind: {project.get('kind')}")
     
-    return formatted
+    return "\n".join(parts) + "\n"
 
 # MCP Tools
 
 @mcp.tool()
 async def get_projects() -> str:
     """Get all projects from TickTick."""
-    if not ticktick:
-        if not initialize_client():
-            return "Failed to initialize TickTick client. Please check your API credentials."
+    ticktick = require_client()
     
     try:
-        projects = ticktick.get_projects()
+        projects = await ticktick.aget_projects()
         if 'error' in projects:
             return f"Error fetching projects: {projects['error']}"
         
@@ -274,12 +417,10 @@ async def get_project(project_id: str) -> str:
     Args:
         project_id: ID of the project
     """
-    if not ticktick:
-        if not initialize_client():
-            return "Failed to initialize TickTick client. Please check your API credentials."
+    ticktick = require_client()
     
     try:
-        project = ticktick.get_project(project_id)
+        project = await ticktick.aget_project(project_id)
         if 'error' in project:
             return f"Error fetching project: {project['error']}"
         
@@ -289,31 +430,35 @@ async def get_project(project_id: str) -> str:
         return f"Error retrieving project: {str(e)}"
 
 @mcp.tool()
-async def get_project_tasks(project_id: str) -> str:
+async def get_project_tasks(project_id: str, limit: int = DEFAULT_PAGE_SIZE, cursor: str = None) -> Union[Dict[str, Any], str]:
     """
-    Get all tasks in a specific project.
+    Get all tasks in a specific project, one page at a time.
     
     Args:
         project_id: ID of the project
+        limit: Maximum number of tasks to return (optional)
+        cursor: The 'next' value from the previous page; omit for the first page (optional)
+    
+    Returns:
+        Structured result {"items": [task, ...], "next": cursor or null}, or an error message
     """
-    if not ticktick:
-        if not initialize_client():
-            return "Failed to initialize TickTick client. Please check your API credentials."
+    ticktick = require_client()
+    
+    error = _validate_page_args(limit, cursor)
+    if error:
+        return error
     
     try:
-        project_data = ticktick.get_project_with_data(project_id)
+        # Open projects are in the task cache when it's warm; only closed or uncached ones need a request
+        snapshot = _fresh_cached_tasks(ticktick)
+        if snapshot and project_id in snapshot['project_tasks']:
+            return _paginate(snapshot['project_tasks'][project_id], limit, cursor)
+        
+        project_data = await ticktick.aget_project_with_data(project_id)
         if 'error' in project_data:
             return f"Error fetching project data: {project_data['error']}"
         
-        tasks = project_data.get('tasks', [])
-        if not tasks:
-            return f"No tasks found in project '{project_data.get('project', {}).get('name', project_id)}'."
-        
-        result = f"Found {len(tasks)} tasks in project '{project_data.get('project', {}).get('name', project_id)}':\n\n"
-        for i, task in enumerate(tasks, 1):
-            result += f"Task {i}:\n" + format_task(task) + "\n"
-        
-        return result
+        return _paginate(project_data.get('tasks', []), limit, cursor)
     except Exception as e:
         logger.error(f"Error in get_project_tasks: {e}")
         return f"Error retrieving project tasks: {str(e)}"
@@ -327,12 +472,10 @@ async def get_task(project_id: str, task_id: str) -> str:
         project_id: ID of the project
         task_id: ID of the task
     """
-    if not ticktick:
-        if not initialize_client():
-            return "Failed to initialize TickTick client. Please check your API credentials."
+    ticktick = require_client()
     
     try:
-        task = ticktick.get_task(project_id, task_id)
+        task = await ticktick.aget_task(project_id, task_id)
         if 'error' in task:
             return f"Error fetching task: {task['error']}"
         
@@ -361,9 +504,7 @@ async def create_task(
         due_date: Due date in ISO format YYYY-MM-DDThh:mm:ss+0000 (optional)
         priority: Priority level (0: None, 1: Low, 3: Medium, 5: High) (optional)
     """
-    if not ticktick:
-        if not initialize_client():
-            return "Failed to initialize TickTick client. Please check your API credentials."
+    ticktick = require_client()
     
     # Validate priority
     if priority not in [0, 1, 3, 5]:
@@ -379,7 +520,8 @@ async def create_task(
                 except ValueError:
                     return f"Invalid {date_name} format. Use ISO format: YYYY-MM-DDThh:mm:ss+0000"
         
-        task = ticktick.create_task(
+        task = await asyncio.to_thread(
+            ticktick.create_task,
             title=title,
             project_id=project_id,
             content=content,
@@ -391,6 +533,7 @@ async def create_task(
         if 'error' in task:
             return f"Error creating task: {task['error']}"
         
+        _invalidate_tasks_cache(ticktick)
         return f"Task created successfully:\n\n" + format_task(task)
     except Exception as e:
         logger.error(f"Error in create_task: {e}")
@@ -418,9 +561,7 @@ async def update_task(
         due_date: New due date in ISO format YYYY-MM-DDThh:mm:ss+0000 (optional)
         priority: New priority level (0: None, 1: Low, 3: Medium, 5: High) (optional)
     """
-    if not ticktick:
-        if not initialize_client():
-            return "Failed to initialize TickTick client. Please check your API credentials."
+    ticktick = require_client()
     
     # Validate priority if provided
     if priority is not None and priority not in [0, 1, 3, 5]:
@@ -436,7 +577,8 @@ async def update_task(
                 except ValueError:
                     return f"Invalid {date_name} format. Use ISO format: YYYY-MM-DDThh:mm:ss+0000"
         
-        task = ticktick.update_task(
+        task = await asyncio.to_thread(
+            ticktick.update_task,
             task_id=task_id,
             project_id=project_id,
             title=title,
@@ -449,6 +591,7 @@ async def update_task(
         if 'error' in task:
             return f"Error updating task: {task['error']}"
         
+        _invalidate_tasks_cache(ticktick)
         return f"Task updated successfully:\n\n" + format_task(task)
     except Exception as e:
         logger.error(f"Error in update_task: {e}")
@@ -463,15 +606,14 @@ async def complete_task(project_id: str, task_id: str) -> str:
         project_id: ID of the project
         task_id: ID of the task
     """
-    if not ticktick:
-        if not initialize_client():
-            return "Failed to initialize TickTick client. Please check your API credentials."
+    ticktick = require_client()
     
     try:
-        result = ticktick.complete_task(project_id, task_id)
+        result = await asyncio.to_thread(ticktick.complete_task, project_id, task_id)
         if 'error' in result:
             return f"Error completing task: {result['error']}"
         
+        _invalidate_tasks_cache(ticktick)
         return f"Task {task_id} marked as complete."
     except Exception as e:
         logger.error(f"Error in complete_task: {e}")
@@ -486,15 +628,14 @@ async def delete_task(project_id: str, task_id: str) -> str:
         project_id: ID of the project
         task_id: ID of the task
     """
-    if not ticktick:
-        if not initialize_client():
-            return "Failed to initialize TickTick client. Please check your API credentials."
+    ticktick = require_client()
     
     try:
-        result = ticktick.delete_task(project_id, task_id)
+        result = await asyncio.to_thread(ticktick.delete_task, project_id, task_id)
         if 'error' in result:
             return f"Error deleting task: {result['error']}"
         
+        _invalidate_tasks_cache(ticktick)
         return f"Task {task_id} deleted successfully."
     except Exception as e:
         logger.error(f"Error in delete_task: {e}")
@@ -514,16 +655,15 @@ async def create_project(
         color: Color code (hex format) (optional)
         view_mode: View mode - one of list, kanban, or timeline (optional)
     """
-    if not ticktick:
-        if not initialize_client():
-            return "Failed to initialize TickTick client. Please check your API credentials."
+    ticktick = require_client()
     
     # Validate view_mode
     if view_mode not in ["list", "kanban", "timeline"]:
         return "Invalid view_mode. Must be one of: list, kanban, timeline."
     
     try:
-        project = ticktick.create_project(
+        project = await asyncio.to_thread(
+            ticktick.create_project,
             name=name,
             color=color,
             view_mode=view_mode
@@ -532,6 +672,7 @@ async def create_project(
         if 'error' in project:
             return f"Error creating project: {project['error']}"
         
+        _invalidate_tasks_cache(ticktick)
         return f"Project created successfully:\n\n" + format_project(project)
     except Exception as e:
         logger.error(f"Error in create_project: {e}")
@@ -545,15 +686,14 @@ async def delete_project(project_id: str) -> str:
     Args:
         project_id: ID of the project
     """
-    if not ticktick:
-        if not initialize_client():
-            return "Failed to initialize TickTick client. Please check your API credentials."
+    ticktick = require_client()
     
     try:
-        result = ticktick.delete_project(project_id)
+        result = await asyncio.to_thread(ticktick.delete_project, project_id)
         if 'error' in result:
             return f"Error deleting project: {result['error']}"
         
+        _invalidate_tasks_cache(ticktick)
         return f"Project {project_id} deleted successfully."
     except Exception as e:
         logger.error(f"Error in delete_project: {e}")
@@ -564,20 +704,36 @@ async def delete_project(project_id: str) -> str:
 
 # Helper Functions
 
-PRIORITY_MAP = {0: "None", 1: "Low", 3: "Medium", 5: "High"}
+@lru_cache(maxsize=1)
+def _today_utc(bucket: int) -> date:
+    """Get today's UTC date; bucket is the current minute (int(time.time()) // 60) so it's computed once a minute."""
+    return datetime.now(timezone.utc).date()
 
-def _is_task_due_today(task: Dict[str, Any]) -> bool:
-    """Check if a task is due today."""
-    due_date = task.get('dueDate')
+def _current_utc_date() -> date:
+    """Get today's UTC date from the per-minute cache. Midnight is on a minute boundary, so it's never stale."""
+    return _today_utc(int(time.time()) // 60)
+
+def _parse_due_date(due_date: Optional[str]) -> Optional[date]:
+    """Parse a TickTick dueDate string into a date, or None if it is missing or malformed."""
     if not due_date:
-        return False
+        return None
+    
+    # Fast path for TickTick's fixed format (YYYY-MM-DDTHH:MM:SS.sss+0000): the date is the first 10 chars
+    if len(due_date) == 28 and due_date[4] == '-' and due_date[7] == '-' and due_date[10] == 'T':
+        try:
+            return date(int(due_date[0:4]), int(due_date[5:7]), int(due_date[8:10]))
+        except ValueError:
+            pass
     
     try:
-        task_due_date = datetime.strptime(due_date, "%Y-%m-%dT%H:%M:%S.%f%z").date()
-        today_date = datetime.now(timezone.utc).date()
-        return task_due_date == today_date
+        return datetime.strptime(due_date, "%Y-%m-%dT%H:%M:%S.%f%z").date()
     except (ValueError, TypeError):
-        return False
+        return None
+
+def _is_task_due_today(task: Dict[str, Any]) -> bool:
+    """Check if a task is due today."""
+    task_due_date = _parse_due_date(task.get('dueDate'))
+    return task_due_date is not None and task_due_date == _current_utc_date()
 
 def _is_task_overdue(task: Dict[str, Any]) -> bool:
     """Check if a task is overdue."""
@@ -593,39 +749,59 @@ def _is_task_overdue(task: Dict[str, Any]) -> bool:
 
 def _is_task_due_in_days(task: Dict[str, Any], days: int) -> bool:
     """Check if a task is due in exactly X days."""
-    due_date = task.get('dueDate')
-    if not due_date:
-        return False
-    
-    try:
-        task_due_date = datetime.strptime(due_date, "%Y-%m-%dT%H:%M:%S.%f%z").date()
-        target_date = (datetime.now(timezone.utc) + timedelta(days=days)).date()
-        return task_due_date == target_date
-    except (ValueError, TypeError):
-        return False
+    task_due_date = _parse_due_date(task.get('dueDate'))
+    target_date = _current_utc_date() + timedelta(days=days)
+    return task_due_date is not None and task_due_date == target_date
 
-def _task_matches_search(task: Dict[str, Any], search_term: str) -> bool:
-    """Check if a task matches the search term (case-insensitive)."""
-    search_term = search_term.lower()
-    
-    # Search in title
-    title = task.get('title', '').lower()
-    if search_term in title:
-        return True
-    
-    # Search in content
-    content = task.get('content', '').lower()
-    if search_term in content:
-        return True
-    
-    # Search in subtasks
-    items = task.get('items', [])
-    for item in items:
-        item_title = item.get('title', '').lower()
-        if search_term in item_title:
-            return True
+# Words (runs of word characters) in search text, used by the search index
+_WORD_RE = re.compile(r"\w+")
+
+def _task_search_blob(task: Dict[str, Any]) -> str:
+    """
+    Build the lowercased text searched by search_tasks: title, content and subtask titles.
     
-    return False
+    Fields are joined with NUL so a search term can't match across two of them.
+    """
+    fields = [task.get('title') or '', task.get('content') or '']
+    fields.extend(item.get('title') or '' for item in task.get('items', []))
+    return "\0".join(fields).lower()
+
+def _build_search_index(search_blobs: List[Tuple[str, Dict]]) -> Dict[str, Set[int]]:
+    """Map every word in the search blobs to the positions of the blobs that contain it."""
+    index = defaultdict(set)
+    for position, (blob, _) in enumerate(search_blobs):
+        for word in _WORD_RE.findall(blob):
+            index[word].add(position)
+    return dict(index)
+
+def _search_snapshot(snapshot: Dict[str, Any], search_term: str) -> List[Dict]:
+    """
+    Find the tasks of a snapshot whose title, content or subtask titles contain search_term
+    (case-insensitive), in snapshot order.
+    
+    A query word with non-word characters on both sides (e.g. "milk" in "buy milk today") must be
+    a whole word of any matching blob, so those words narrow the candidates through exact lookups
+    in the word index, which is built on the first such search of a snapshot. The first and last
+    words may be partial, so queries without whole words use the plain blob scan. Only candidates
+    get the full substring check.
+    """
+    search_lower = search_term.lower()
+    search_blobs = snapshot['search_blobs']
+    whole_words = {
+        match.group() for match in _WORD_RE.finditer(search_lower)
+        if match.start() > 0 and match.end() < len(search_lower)
+    }
+    
+    candidates = range(len(search_blobs))
+    if whole_words:
+        index = snapshot.get('search_index')
+        if index is None:
+            index = snapshot['search_index'] = _build_search_index(search_blobs)
+        # Smallest posting sets first so the intersection shrinks fastest
+        postings = sorted((index.get(word, set()) for word in whole_words), key=len)
+        candidates = sorted(set.intersection(*postings))
+    
+    return [search_blobs[i][1] for i in candidates if search_lower in search_blobs[i][0]]
 
 def _validate_task_data(task_data: Dict[str, Any], task_index: int) -> Optional[str]:
     """
@@ -665,18 +841,172 @@ def _validate_task_data(task_data: Dict[str, Any], task_index: int) -> Optional[
     
     return None
 
-def _get_project_tasks_by_filter(projects: List[Dict], filter_func, filter_name: str) -> str:
+def _validate_page_args(limit: int, cursor: Optional[str]) -> Optional[str]:
+    """
+    Validate pagination arguments passed to a paginated tool.
+    
+    Returns:
+        None if valid, error message string if invalid
+    """
+    if limit < 1:
+        return "Limit must be a positive integer."
+    
+    if cursor is not None and _decode_cursor(cursor) is None:
+        return "Invalid cursor. Pass the 'next' value returned by the previous page."
+    
+    return None
+
+def _page_key(task: Dict) -> Tuple[str, str]:
+    """Get the stable sort key pages are ordered and resumed by: (project ID, task ID)."""
+    return (task.get('projectId') or '', task.get('id') or '')
+
+def _encode_cursor(key: Tuple[str, str]) -> str:
+    """Encode the page key of the last task of a page as an opaque cursor."""
+    return base64.urlsafe_b64encode(orjson.dumps(key)).decode()
+
+def _decode_cursor(cursor: str) -> Optional[Tuple[str, str]]:
+    """Decode a cursor made by _encode_cursor, or None if it isn't one."""
+    try:
+        key = orjson.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (ValueError, binascii.Error):
+        return None
+    if not (isinstance(key, list) and len(key) == 2 and all(isinstance(part, str) for part in key)):
+        return None
+    return (key[0], key[1])
+
+def _paginate(items: List[Dict], limit: int, cursor: Optional[str]) -> Dict[str, Any]:
+    """
+    Get one page of tasks as a structured tool result.
+    
+    Tasks are ordered by (project ID, task ID) and the cursor is the key of the last task returned,
+    so a page resumes right after it even if tasks were created, completed or deleted in between.
+    
+    Args:
+        items: Full list of tasks to page through
+        limit: Maximum number of tasks in the page
+        cursor: Cursor from the previous page, or None for the first page
+    
+    Returns:
+        Dict {"items": [...], "next": cursor for the next page or None}
+    """
+    items = sorted(items, key=_page_key)
+    start = bisect.bisect_right(items, _decode_cursor(cursor), key=_page_key) if cursor else 0
+    page = items[start:start + limit]
+    next_cursor = _encode_cursor(_page_key(page[-1])) if start + limit < len(items) else None
+    return {"items": page, "next": next_cursor}
+
+async def _fetch_all_tasks_async(ticktick: "TickTickClient") -> Dict[str, Any]:
+    """
+    Fetch all projects and the tasks of every open project.
+    
+    Project task lists are fetched concurrently over the client's shared HTTP/2 connection pool
+    (at most PROJECT_FETCH_CONCURRENCY at a time), so the wall time is roughly one round trip
+    instead of one per project.
+    
+    Returns:
+        Snapshot dict with 'projects' (as returned by TickTick), 'project_tasks'
+        (project ID -> list of tasks), 'tasks' (all tasks of open projects, in project order) and
+        'due_dates'/'due_tasks' (tasks with a due date, sorted by it) and 'search_blobs'
+        ((lowercased searchable text, task) pairs), or a dict with 'error' if projects can't be
+        fetched. _search_snapshot adds 'search_index' (word -> search_blobs positions) when needed
+    """
+    projects = await ticktick.aget_projects()
+    if 'error' in projects:
+        return {"error": projects['error']}
+    
+    semaphore = asyncio.Semaphore(PROJECT_FETCH_CONCURRENCY)
+    
+    async def fetch_project_data(project_id: str) -> Dict:
+        async with semaphore:
+            return await ticktick.aget_project_with_data(project_id)
+    
+    project_ids = [project.get('id', 'No ID') for project in projects if not project.get('closed')]
+    results = await asyncio.gather(*(fetch_project_data(project_id) for project_id in project_ids))
+    
+    project_tasks = {}
+    complete = True
+    for project_id, project_data in zip(project_ids, results):
+        if 'error' in project_data:
+            logger.warning(f"Failed to fetch tasks for project {project_id}: {project_data['error']}")
+            complete = False
+        project_tasks[project_id] = project_data.get('tasks', [])
+    
+    tasks = [task for project_id in project_ids for task in project_tasks[project_id]]
+    
+    # Parse due dates once here so date filters can bisect instead of re-parsing every task
+    dated_tasks = []
+    for task in tasks:
+        due_date = _parse_due_date(task.get('dueDate'))
+        if due_date is not None:
+            dated_tasks.append((due_date, task))
+    dated_tasks.sort(key=lambda entry: entry[0])
+    
+    search_blobs = [(_task_search_blob(task), task) for task in tasks]
+    
+    return {
+        "projects": projects,
+        "project_tasks": project_tasks,
+        "tasks": tasks,
+        "due_dates": [due_date for due_date, _ in dated_tasks],
+        "due_tasks": [task for _, task in dated_tasks],
+        "search_blobs": search_blobs,
+        "complete": complete,
+    }
+
+def _tasks_cache_key(ticktick: "TickTickClient") -> str:
+    """Get the task cache key for a client: the key it was registered under in initialize_client."""
+    return getattr(ticktick, "cache_key", None) or _token_key(ticktick.access_token)
+
+def _fresh_cached_tasks(ticktick: "TickTickClient") -> Optional[Dict[str, Any]]:
+    """Get the cached task snapshot for the client's token if it hasn't expired, without fetching."""
+    key = _tasks_cache_key(ticktick)
+    cached = _tasks_cache.get(key)
+    if cached:
+        if time.monotonic() < cached[1]:
+            return cached[0]
+        del _tasks_cache[key]
+    return None
+
+async def _cached_all_tasks(ticktick: "TickTickClient") -> Dict[str, Any]:
+    """
+    Get the task snapshot for the client's token, reusing it for TASKS_CACHE_TTL seconds.
+    
+    Incomplete snapshots (some project failed to load) and errors are never cached.
+    """
+    cached = _fresh_cached_tasks(ticktick)
+    if cached:
+        return cached
+    
+    snapshot = await _fetch_all_tasks_async(ticktick)
+    if 'error' not in snapshot and snapshot['complete']:
+        _cache_put(_tasks_cache, _tasks_cache_key(ticktick),
+                   (snapshot, time.monotonic() + TASKS_CACHE_TTL), TASKS_CACHE_MAX_ENTRIES)
+    return snapshot
+
+def _tasks_due_between(snapshot: Dict[str, Any], start: date, end: date) -> List[Dict]:
+    """Get the tasks of a snapshot due between start and end (inclusive)."""
+    due_dates = snapshot['due_dates']
+    lo = bisect.bisect_left(due_dates, start)
+    hi = bisect.bisect_right(due_dates, end)
+    return snapshot['due_tasks'][lo:hi]
+
+def _invalidate_tasks_cache(ticktick: "TickTickClient") -> None:
+    """Drop the cached task snapshot for the client's token after a write."""
+    _tasks_cache.pop(_tasks_cache_key(ticktick), None)
+
+def _get_project_tasks_by_filter(snapshot: Dict[str, Any], filter_func, filter_name: str) -> str:
     """
     Helper function to filter tasks across all projects.
     
     Args:
-        projects: List of project dictionaries
+        snapshot: Task snapshot from _cached_all_tasks()
         filter_func: Function that takes a task and returns True if it matches the filter
         filter_name: Name of the filter for output formatting
     
     Returns:
         Formatted string of filtered tasks
     """
+    projects = snapshot['projects']
     if not projects:
         return "No projects found."
     
@@ -687,8 +1017,7 @@ def _get_project_tasks_by_filter(projects: List[Dict], filter_func, filter_name:
             continue
             
         project_id = project.get('id', 'No ID')
-        project_data = ticktick.get_project_with_data(project_id)
-        tasks = project_data.get('tasks', [])
+        tasks = snapshot['project_tasks'].get(project_id, [])
         
         if not tasks:
             result += f"Project {i}:\n{format_project(project)}"
@@ -711,21 +1040,29 @@ def _get_project_tasks_by_filter(projects: List[Dict], filter_func, filter_name:
 # New MCP Tools for Tasks
 
 @mcp.tool()
-async def get_all_tasks() -> str:
-    """Get all tasks from TickTick. Ignores closed projects."""
-    if not ticktick:
-        if not initialize_client():
-            return "Failed to initialize TickTick client. Please check your API credentials."
+async def get_all_tasks(limit: int = DEFAULT_PAGE_SIZE, cursor: str = None) -> Union[Dict[str, Any], str]:
+    """
+    Get all tasks from TickTick, one page at a time. Ignores closed projects.
+    
+    Args:
+        limit: Maximum number of tasks to return (optional)
+        cursor: The 'next' value from the previous page; omit for the first page (optional)
+    
+    Returns:
+        Structured result {"items": [task, ...], "next": cursor or null}, or an error message
+    """
+    ticktick = require_client()
+    
+    error = _validate_page_args(limit, cursor)
+    if error:
+        return error
     
     try:
-        projects = ticktick.get_projects()
-        if 'error' in projects:
-            return f"Error fetching projects: {projects['error']}"
-        
-        def all_tasks_filter(task: Dict[str, Any]) -> bool:
-            return True  # Include all tasks
+        snapshot = await _cached_all_tasks(ticktick)
+        if 'error' in snapshot:
+            return f"Error fetching projects: {snapshot['error']}"
         
-        return _get_project_tasks_by_filter(projects, all_tasks_filter, "included")
+        return _paginate(snapshot['tasks'], limit, cursor)
         
     except Exception as e:
         logger.error(f"Error in get_all_tasks: {e}")
@@ -739,23 +1076,21 @@ async def get_tasks_by_priority(priority_id: int) -> str:
     Args:
         priority_id: Priority of tasks to retrieve {0: "None", 1: "Low", 3: "Medium", 5: "High"}
     """
-    if not ticktick:
-        if not initialize_client():
-            return "Failed to initialize TickTick client. Please check your API credentials."
+    ticktick = require_client()
     
     if priority_id not in PRIORITY_MAP:
         return f"Invalid priority_id. Valid values: {list(PRIORITY_MAP.keys())}"
     
     try:
-        projects = ticktick.get_projects()
-        if 'error' in projects:
-            return f"Error fetching projects: {projects['error']}"
+        snapshot = await _cached_all_tasks(ticktick)
+        if 'error' in snapshot:
+            return f"Error fetching projects: {snapshot['error']}"
         
         def priority_filter(task: Dict[str, Any]) -> bool:
             return task.get('priority', 0) == priority_id
         
         priority_name = f"{PRIORITY_MAP[priority_id]} ({priority_id})"
-        return _get_project_tasks_by_filter(projects, priority_filter, f"priority '{priority_name}'")
+        return _get_project_tasks_by_filter(snapshot, priority_filter, f"priority '{priority_name}'")
         
     except Exception as e:
         logger.error(f"Error in get_tasks_by_priority: {e}")
@@ -764,19 +1099,20 @@ async def get_tasks_by_priority(priority_id: int) -> str:
 @mcp.tool()
 async def get_tasks_due_today() -> str:
     """Get all tasks from TickTick that are due today. Ignores closed projects."""
-    if not ticktick:
-        if not initialize_client():
-            return "Failed to initialize TickTick client. Please check your API credentials."
+    ticktick = require_client()
     
     try:
-        projects = ticktick.get_projects()
-        if 'error' in projects:
-            return f"Error fetching projects: {projects['error']}"
+        snapshot = await _cached_all_tasks(ticktick)
+        if 'error' in snapshot:
+            return f"Error fetching projects: {snapshot['error']}"
+        
+        today = _current_utc_date()
+        due_today = {id(task) for task in _tasks_due_between(snapshot, today, today)}
         
         def today_filter(task: Dict[str, Any]) -> bool:
-            return _is_task_due_today(task)
+            return id(task) in due_today
         
-        return _get_project_tasks_by_filter(projects, today_filter, "due today")
+        return _get_project_tasks_by_filter(snapshot, today_filter, "due today")
         
     except Exception as e:
         logger.error(f"Error in get_tasks_due_today: {e}")
@@ -785,19 +1121,17 @@ async def get_tasks_due_today() -> str:
 @mcp.tool()
 async def get_overdue_tasks() -> str:
     """Get all overdue tasks from TickTick. Ignores closed projects."""
-    if not ticktick:
-        if not initialize_client():
-            return "Failed to initialize TickTick client. Please check your API credentials."
+    ticktick = require_client()
     
     try:
-        projects = ticktick.get_projects()
-        if 'error' in projects:
-            return f"Error fetching projects: {projects['error']}"
+        snapshot = await _cached_all_tasks(ticktick)
+        if 'error' in snapshot:
+            return f"Error fetching projects: {snapshot['error']}"
         
         def overdue_filter(task: Dict[str, Any]) -> bool:
             return _is_task_overdue(task)
         
-        return _get_project_tasks_by_filter(projects, overdue_filter, "overdue")
+        return _get_project_tasks_by_filter(snapshot, overdue_filter, "overdue")
         
     except Exception as e:
         logger.error(f"Error in get_overdue_tasks: {e}")
@@ -806,19 +1140,20 @@ async def get_overdue_tasks() -> str:
 @mcp.tool()
 async def get_tasks_due_tomorrow() -> str:
     """Get all tasks from TickTick that are due today. Ignores closed projects."""
-    if not ticktick:
-        if not initialize_client():
-            return "Failed to initialize TickTick client. Please check your API credentials."
+    ticktick = require_client()
     
     try:
-        projects = ticktick.get_projects()
-        if 'error' in projects:
-            return f"Error fetching projects: {projects['error']}"
+        snapshot = await _cached_all_tasks(ticktick)
+        if 'error' in snapshot:
+            return f"Error fetching projects: {snapshot['error']}"
+        
+        tomorrow = _current_utc_date() + timedelta(days=1)
+        due_tomorrow = {id(task) for task in _tasks_due_between(snapshot, tomorrow, tomorrow)}
         
         def today_filter(task: Dict[str, Any]) -> bool:
-            return _is_task_due_in_days(task, 1)
+            return id(task) in due_tomorrow
         
-        return _get_project_tasks_by_filter(projects, today_filter, "due today")
+        return _get_project_tasks_by_filter(snapshot, today_filter, "due today")
         
     except Exception as e:
         logger.error(f"Error in get_tasks_due_today: {e}")
@@ -832,23 +1167,24 @@ async def get_tasks_due_in_days(days: int) -> str:
     Args:
         days: Number of days from today (0 = today, 1 = tomorrow, etc.)
     """
-    if not ticktick:
-        if not initialize_client():
-            return "Failed to initialize TickTick client. Please check your API credentials."
+    ticktick = require_client()
     
     if days < 0:
         return "Days must be a non-negative integer."
     
     try:
-        projects = ticktick.get_projects()
-        if 'error' in projects:
-            return f"Error fetching projects: {projects['error']}"
+        snapshot = await _cached_all_tasks(ticktick)
+        if 'error' in snapshot:
+            return f"Error fetching projects: {snapshot['error']}"
+        
+        target_date = _current_utc_date() + timedelta(days=days)
+        due_on_target = {id(task) for task in _tasks_due_between(snapshot, target_date, target_date)}
         
         def days_filter(task: Dict[str, Any]) -> bool:
-            return _is_task_due_in_days(task, days)
+            return id(task) in due_on_target
         
         day_description = "today" if days == 0 else f"in {days} day{'s' if days != 1 else ''}"
-        return _get_project_tasks_by_filter(projects, days_filter, f"due {day_description}")
+        return _get_project_tasks_by_filter(snapshot, days_filter, f"due {day_description}")
         
     except Exception as e:
         logger.error(f"Error in get_tasks_due_in_days: {e}")
@@ -857,58 +1193,54 @@ async def get_tasks_due_in_days(days: int) -> str:
 @mcp.tool()
 async def get_tasks_due_this_week() -> str:
     """Get all tasks from TickTick that are due within the next 7 days. Ignores closed projects."""
-    if not ticktick:
-        if not initialize_client():
-            return "Failed to initialize TickTick client. Please check your API credentials."
+    ticktick = require_client()
     
     try:
-        projects = ticktick.get_projects()
-        if 'error' in projects:
-            return f"Error fetching projects: {projects['error']}"
+        snapshot = await _cached_all_tasks(ticktick)
+        if 'error' in snapshot:
+            return f"Error fetching projects: {snapshot['error']}"
+        
+        today = _current_utc_date()
+        due_this_week = {id(task) for task in _tasks_due_between(snapshot, today, today + timedelta(days=7))}
         
         def week_filter(task: Dict[str, Any]) -> bool:
-            due_date = task.get('dueDate')
-            if not due_date:
-                return False
-            
-            try:
-                task_due_date = datetime.strptime(due_date, "%Y-%m-%dT%H:%M:%S.%f%z").date()
-                today = datetime.now(timezone.utc).date()
-                week_from_today = today + timedelta(days=7)
-                return today <= task_due_date <= week_from_today
-            except (ValueError, TypeError):
-                return False
+            return id(task) in due_this_week
         
-        return _get_project_tasks_by_filter(projects, week_filter, "due this week")
+        return _get_project_tasks_by_filter(snapshot, week_filter, "due this week")
         
     except Exception as e:
         logger.error(f"Error in get_tasks_due_this_week: {e}")
         return f"Error retrieving projects: {str(e)}"
 
 @mcp.tool()
-async def search_tasks(search_term: str) -> str:
+async def search_tasks(search_term: str, limit: int = DEFAULT_PAGE_SIZE, cursor: str = None) -> Union[Dict[str, Any], str]:
     """
-    Search for tasks in TickTick by title, content, or subtask titles. Ignores closed projects.
+    Search for tasks in TickTick by title, content, or subtask titles, one page at a time.
+    Ignores closed projects.
     
     Args:
         search_term: Text to search for (case-insensitive)
+        limit: Maximum number of tasks to return (optional)
+        cursor: The 'next' value from the previous page; omit for the first page (optional)
+    
+    Returns:
+        Structured result {"items": [task, ...], "next": cursor or null}, or an error message
     """
-    if not ticktick:
-        if not initialize_client():
-            return "Failed to initialize TickTick client. Please check your API credentials."
+    ticktick = require_client()
     
     if not search_term.strip():
         return "Search term cannot be empty."
     
+    error = _validate_page_args(limit, cursor)
+    if error:
+        return error
+    
     try:
-        projects = ticktick.get_projects()
-        if 'error' in projects:
-            return f"Error fetching projects: {projects['error']}"
-        
-        def search_filter(task: Dict[str, Any]) -> bool:
-            return _task_matches_search(task, search_term)
+        snapshot = await _cached_all_tasks(ticktick)
+        if 'error' in snapshot:
+            return f"Error fetching projects: {snapshot['error']}"
         
-        return _get_project_tasks_by_filter(projects, search_filter, f"matching '{search_term}'")
+        return _paginate(_search_snapshot(snapshot, search_term), limit, cursor)
         
     except Exception as e:
         logger.error(f"Error in search_tasks: {e}")
@@ -934,9 +1266,7 @@ async def batch_create_tasks(tasks: List[Dict[str, Any]]) -> str:
             {"title": "Example B", "project_id": "1234XYZ", "content": "Description", "start_date": "2025-07-18T10:00:00", "due_date": "2025-07-19T10:00:00"}
         ]
     """
-    if not ticktick:
-        if not initialize_client():
-            return "Failed to initialize TickTick client. Please check your API credentials."
+    ticktick = require_client()
     
     if not tasks:
         return "No tasks provided. Please provide a list of tasks to create."
@@ -974,7 +1304,8 @@ async def batch_create_tasks(tasks: List[Dict[str, Any]]) -> str:
                 priority = task_data.get('priority', 0)
                 
                 # Create the task
-                result = ticktick.create_task(
+                result = await asyncio.to_thread(
+                    ticktick.create_task,
                     title=title,
                     project_id=project_id,
                     content=content,
@@ -991,6 +1322,9 @@ async def batch_create_tasks(tasks: List[Dict[str, Any]]) -> str:
             except Exception as e:
                 failed_tasks.append(f"Task {i + 1} ('{task_data.get('title', 'Unknown')}'): {str(e)}")
         
+        if created_tasks:
+            _invalidate_tasks_cache(ticktick)
+        
         # Format the results
         result_message = f"Batch task creation completed.\n\n"
         result_message += f"Successfully created: {len(created_tasks)} tasks\n"
@@ -1021,14 +1355,12 @@ async def get_engaged_tasks() -> str:
     Get all tasks from TickTick that are "Engaged".
     This includes tasks marked as high priority (5), due today or overdue.
     """
-    if not ticktick:
-        if not initialize_client():
-            return "Failed to initialize TickTick client. Please check your API credentials."
+    ticktick = require_client()
     
     try:
-        projects = ticktick.get_projects()
-        if 'error' in projects:
-            return f"Error fetching projects: {projects['error']}"
+        snapshot = await _cached_all_tasks(ticktick)
+        if 'error' in snapshot:
+            return f"Error fetching projects: {snapshot['error']}"
         
         def engaged_filter(task: Dict[str, Any]) -> bool:
             is_high_priority = task.get('priority', 0) == 5
@@ -1036,7 +1368,7 @@ async def get_engaged_tasks() -> str:
             is_today = _is_task_due_today(task)
             return is_high_priority or is_overdue or is_today
         
-        return _get_project_tasks_by_filter(projects, engaged_filter, "engaged")
+        return _get_project_tasks_by_filter(snapshot, engaged_filter, "engaged")
         
     except Exception as e:
         logger.error(f"Error in get_engaged_tasks: {e}")
@@ -1048,26 +1380,62 @@ async def get_next_tasks() -> str:
     Get all tasks from TickTick that are "Next".
     This includes tasks marked as medium priority (3) or due tomorrow.
     """
-    if not ticktick:
-        if not initialize_client():
-            return "Failed to initialize TickTick client. Please check your API credentials."
+    ticktick = require_client()
     
     try:
-        projects = ticktick.get_projects()
-        if 'error' in projects:
-            return f"Error fetching projects: {projects['error']}"
+        snapshot = await _cached_all_tasks(ticktick)
+        if 'error' in snapshot:
+            return f"Error fetching projects: {snapshot['error']}"
         
         def next_filter(task: Dict[str, Any]) -> bool:
             is_medium_priority = task.get('priority', 0) == 3
             is_due_tomorrow = _is_task_due_in_days(task, 1)
             return is_medium_priority or is_due_tomorrow
         
-        return _get_project_tasks_by_filter(projects, next_filter, "next")
+        return _get_project_tasks_by_filter(snapshot, next_filter, "next")
         
     except Exception as e:
         logger.error(f"Error in get_next_tasks: {e}")
         return f"Error retrieving projects: {str(e)}"
 
+@mcp.tool()
+async def get_dashboard() -> str:
+    """
+    Get a TickTick overview in one call: open projects, tasks due today, overdue tasks
+    and high priority (5) tasks. Ignores closed projects.
+    """
+    ticktick = require_client()
+    
+    try:
+        snapshot = await _cached_all_tasks(ticktick)
+        if 'error' in snapshot:
+            return f"Error fetching projects: {snapshot['error']}"
+        
+        today = _current_utc_date()
+        open_projects = [project for project in snapshot['projects'] if not project.get('closed')]
+        # Only tasks due up to today can be overdue, so check just those
+        overdue_candidates = _tasks_due_between(snapshot, date.min, today)
+        sections = [
+            ("Due today", _tasks_due_between(snapshot, today, today)),
+            ("Overdue", [task for task in overdue_candidates if _is_task_overdue(task)]),
+            ("High priority", [task for task in snapshot['tasks'] if task.get('priority', 0) == 5]),
+        ]
+        
+        parts = [f"Projects ({len(open_projects)}):\n"]
+        for i, project in enumerate(open_projects, 1):
+            parts.append(f"Project {i}:\n{format_project(project)}")
+        
+        for section_name, tasks in sections:
+            parts.append(f"\n{section_name} ({len(tasks)}):\n")
+            for i, task in enumerate(tasks, 1):
+                parts.append(f"Task {i}:\n{format_task(task)}")
+        
+        return "\n".join(parts)
+        
+    except Exception as e:
+        logger.error(f"Error in get_dashboard: {e}")
+        return f"Error retrieving dashboard: {str(e)}"
+
 @mcp.tool()
 async def create_subtask(
     subtask_title: str,
@@ -1086,16 +1454,15 @@ async def create_subtask(
         content: Optional content/description for the subtask
         priority: Priority level (0: None, 1: Low, 3: Medium, 5: High) (optional)
     """
-    if not ticktick:
-        if not initialize_client():
-            return "Failed to initialize TickTick client. Please check your API credentials."
+    ticktick = require_client()
     
     # Validate priority
     if priority not in [0, 1, 3, 5]:
         return "Invalid priority. Must be 0 (None), 1 (Low), 3 (Medium), or 5 (High)."
     
     try:
-        subtask = ticktick.create_subtask(
+        subtask = await asyncio.to_thread(
+            ticktick.create_subtask,
             subtask_title=subtask_title,
             parent_task_id=parent_task_id,
             project_id=project_id,
@@ -1106,6 +1473,7 @@ async def create_subtask(
         if 'error' in subtask:
             return f"Error creating subtask: {subtask['error']}"
         
+        _invalidate_tasks_cache(ticktick)
         return f"Subtask created successfully:\n\n" + format_task(subtask)
     except Exception as e:
         logger.error(f"Error in create_subtask: {e}")
@@ -1117,11 +1485,9 @@ async def test_tool() -> str:
     """
     Test tool.
     """
-    if not ticktick:
-        if not initialize_client():
-            return "Failed to initialize TickTick client. Please check your API credentials."
+    ticktick = require_client()
     
-    projects = ticktick.get_projects()
+    projects = await ticktick.aget_projects()
     if 'error' in projects:
         return f"Error fetching projects: {projects['error']}"
     
@@ -1129,8 +1495,15 @@ async def test_tool() -> str:
 
 def main():
     """Main entry point for the MCP server."""
-    # Run the server with SSE transport
-    mcp.run(transport="sse")
+    # Use uvloop when available (uvicorn already picks httptools over h11 when it's installed)
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    
+    # Run the server with SSE transport, without writing an access log line per request
+    mcp.run(transport="sse", uvicorn_config={"access_log": False})
 
 if __name__ == "__main__":
     # Use FastMCP's built-in server for simpler configuration
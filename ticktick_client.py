@@ -1,8 +1,11 @@
 import os
 import json
 import base64
+import asyncio
+import httpx
 import requests
 import logging
+import weakref
 from pathlib import Path
 from dotenv import load_dotenv
 from typing import Dict, List, Any, Optional, Tuple
@@ -10,6 +13,27 @@ from typing import Dict, List, Any, Optional, Tuple
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Timeout for async API requests. requests had none; httpx defaults to 5 seconds, which large
+# /project/{id}/data responses can exceed
+ASYNC_REQUEST_TIMEOUT = httpx.Timeout(float(os.getenv("TICKTICK_REQUEST_TIMEOUT", "60")), connect=10.0)
+
+# Shared async HTTP clients so every TickTickClient reuses the same pooled keep-alive connections.
+# An httpx client is bound to the event loop it first ran on, so there is one per loop, dropped with it.
+_httpx_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+def _get_async_http_client() -> httpx.AsyncClient:
+    """Get the shared HTTP/2 client for the running event loop, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    client = _httpx_clients.get(loop)
+    if client is None:
+        client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            timeout=ASYNC_REQUEST_TIMEOUT,
+        )
+        _httpx_clients[loop] = client
+    return client
+
 class TickTickClient:
     """
     Client for the TickTick API using OAuth2 authentication.
@@ -174,6 +198,53 @@ class TickTickClient:
             logger.error(f"API request failed: {e}")
             return {"error": str(e)}
     
+    async def _amake_request(self, method: str, endpoint: str, data=None) -> Dict:
+        """
+        Makes an asynchronous request to the TickTick API using the shared HTTP/2 client.
+        
+        Args:
+            method: HTTP method (GET, POST, DELETE)
+            endpoint: API endpoint (without base URL)
+            data: Request data (for POST)
+        
+        Returns:
+            API response as a dictionary
+        """
+        if method not in ("GET", "POST", "DELETE"):
+            raise ValueError(f"Unsupported HTTP method: {method}")
+        
+        url = f"{self.base_url}{endpoint}"
+        client = _get_async_http_client()
+        
+        def headers() -> Dict[str, str]:
+            # httpx can't drop a header set to None like requests does, so ask for no encoding instead
+            return {**self.headers, "Accept-Encoding": "identity"}
+        
+        try:
+            response = await client.request(method, url, headers=headers(), json=data)
+            
+            # Check if the request was unauthorized (401)
+            if response.status_code == 401:
+                logger.info("Access token expired. Attempting to refresh...")
+                
+                # Try to refresh the access token, then retry the request with the new token
+                if await asyncio.to_thread(self._refresh_access_token):
+                    response = await client.request(method, url, headers=headers(), json=data)
+            
+            # Raise an exception for 4xx/5xx status codes
+            response.raise_for_status()
+            
+            # Return empty dict for 204 No Content
+            if response.status_code == 204 or response.text == "":
+                return {}
+            
+            return response.json()
+        except (httpx.HTTPError, httpx.InvalidURL, httpx.StreamError, ValueError) as e:
+            # Like requests' RequestException: transport, URL and stream errors, and (ValueError)
+            # non-JSON bodies (json.JSONDecodeError)
+            logger.error(f"API request failed: {e}")
+            return {"error": str(e)}
+    
     # Project methods
     def get_projects(self) -> List[Dict]:
         """Gets all projects for the user."""
@@ -187,6 +258,18 @@ class TickTickClient:
         """Gets project with tasks and columns."""
         return self._make_request("GET", f"/project/{project_id}/data")
     
+    async def aget_projects(self) -> List[Dict]:
+        """Gets all projects for the user without blocking the event loop."""
+        return await self._amake_request("GET", "/project")
+    
+    async def aget_project(self, project_id: str) -> Dict:
+        """Gets a specific project by ID without blocking the event loop."""
+        return await self._amake_request("GET", f"/project/{project_id}")
+    
+    async def aget_project_with_data(self, project_id: str) -> Dict:
+        """Gets project with tasks and columns without blocking the event loop."""
+        return await self._amake_request("GET", f"/project/{project_id}/data")
+    
     def create_project(self, name: str, color: str = "#F18181", view_mode: str = "list", kind: str = "TASK") -> Dict:
         """Creates a new project."""
         data = {
@@ -221,6 +304,10 @@ class TickTickClient:
         """Gets a specific task by project ID and task ID."""
         return self._make_request("GET", f"/project/{project_id}/task/{task_id}")
     
+    async def aget_task(self, project_id: str, task_id: str) -> Dict:
+        """Gets a specific task by project ID and task ID without blocking the event loop."""
+        return await self._amake_request("GET", f"/project/{project_id}/task/{task_id}")
+    
     def create_task(self, title: str, project_id: str, content: str = None, 
                    start_date: str = None, due_date: str = None, 
                    priority: int = 0, is_all_day: bool = False) -> Dict: